@@ -15,13 +15,9 @@ if not os.getenv("OPENAI_API_KEY"):
 
 llm = ChatOpenAI(temperature=0.7, model_name="gpt-4")
 
-def generate_career_path(job_title: str, experience: str, skills: list[str]):
-    """
-    Generates a personalized career path recommendation using an AI model.
-    """
-    prompt = PromptTemplate(
-        input_variables=["job_title", "experience", "skills"],
-        template="""
+career_path_prompt = PromptTemplate(
+    input_variables=["job_title", "experience", "skills"],
+    template="""
         As a career advisor, create a personalized career path recommendation for a user with the following profile:
 
         Current Role/Aspired Role: {job_title}
@@ -36,21 +32,21 @@ def generate_career_path(job_title: str, experience: str, skills: list[str]):
 
         Present the information in a clear, structured format.
         """
-    )
+)
+career_path_chain = LLMChain(llm=llm, prompt=career_path_prompt)
 
+def generate_career_path(job_title: str, experience: str, skills: list[str]):
+    """
+    Generates a personalized career path recommendation using an AI model.
+    """
     skill_str = ", ".join(skills)
-    chain = LLMChain(llm=llm, prompt=prompt)
-    response = chain.run(job_title=job_title, experience=experience, skills=skill_str)
+    response = career_path_chain.run(job_title=job_title, experience=experience, skills=skill_str)
     
     return response
 
-def analyze_skill_gap(skills: list[str], job_description: str):
-    """
-    Analyzes the gap between a user's skills and a job description.
-    """
-    prompt = PromptTemplate(
-        input_variables=["skills", "job_description"],
-        template="""
+skill_gap_prompt = PromptTemplate(
+    input_variables=["skills", "job_description"],
+    template="""
         As a career advisor, analyze the skill gap between the user's current skills and the provided job description.
 
         User's Skills: {skills}
@@ -65,21 +61,21 @@ def analyze_skill_gap(skills: list[str], job_description: str):
 
         Present the information in a clear, structured format.
         """
-    )
+)
+skill_gap_chain = LLMChain(llm=llm, prompt=skill_gap_prompt)
 
+def analyze_skill_gap(skills: list[str], job_description: str):
+    """
+    Analyzes the gap between a user's skills and a job description.
+    """
     skill_str = ", ".join(skills)
-    chain = LLMChain(llm=llm, prompt=prompt)
-    response = chain.run(skills=skill_str, job_description=job_description)
+    response = skill_gap_chain.run(skills=skill_str, job_description=job_description)
 
     return response
 
-def optimize_resume(resume_text: str, job_description: str):
-    """
-    Optimizes a user's resume for a specific job description.
-    """
-    prompt = PromptTemplate(
-        input_variables=["resume_text", "job_description"],
-        template="""
+resume_optimization_prompt = PromptTemplate(
+    input_variables=["resume_text", "job_description"],
+    template="""
         As a professional resume writer and career coach, please analyze the following resume and job description. Provide actionable advice to optimize the resume for this specific role.
 
         User's Resume:
@@ -96,20 +92,20 @@ def optimize_resume(resume_text: str, job_description: str):
 
         Present the information in a clear, structured, and easy-to-read format.
         """
-    )
+)
+resume_optimization_chain = LLMChain(llm=llm, prompt=resume_optimization_prompt)
 
-    chain = LLMChain(llm=llm, prompt=prompt)
-    response = chain.run(resume_text=resume_text, job_description=job_description)
+def optimize_resume(resume_text: str, job_description: str):
+    """
+    Optimizes a user's resume for a specific job description.
+    """
+    response = resume_optimization_chain.run(resume_text=resume_text, job_description=job_description)
 
     return response
 
-def parse_resume_content(resume_text: str):
-    """
-    Intelligently parses resume content using AI to extract structured information.
-    """
-    prompt = PromptTemplate(
-        input_variables=["resume_text"],
-        template="""
+resume_parse_prompt = PromptTemplate(
+    input_variables=["resume_text"],
+    template="""
         As an expert resume parser, analyze the following resume text and extract key information in a structured JSON format.
 
         Resume Text:
@@ -135,9 +131,13 @@ def parse_resume_content(resume_text: str):
         - For lastTwoJobs, extract the actual job titles, not company names
         - Return only valid JSON, no additional text or explanations
         """
-    )
+)
+resume_parse_chain = LLMChain(llm=llm, prompt=resume_parse_prompt)
 
-    chain = LLMChain(llm=llm, prompt=prompt)
-    response = chain.run(resume_text=resume_text)
+def parse_resume_content(resume_text: str):
+    """
+    Intelligently parses resume content using AI to extract structured information.
+    """
+    response = resume_parse_chain.run(resume_text=resume_text)
     
     return response 
\ No newline at end of file
@@ -2,7 +2,7 @@ import os
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from typing import Optional, Dict, Any
-import json
+import orjson
 from datetime import datetime
 
 load_dotenv()
@@ -36,6 +36,9 @@ class CVRecordService:
             import base64
             file_content_b64 = base64.b64encode(file_content).decode('utf-8')
             
+            # Stamp both timestamps from a single clock read so they match
+            now = datetime.utcnow().isoformat()
+            
             cv_data = {
                 "user_id": user_id,
                 "filename": filename,
@@ -47,12 +50,12 @@ class CVRecordService:
                 "phone": parsed_data.get("phone"),
                 "location": parsed_data.get("location"),
                 "experience": parsed_data.get("experience"),
-                "skills": json.dumps(parsed_data.get("skills", [])),
+                "skills": orjson.dumps(parsed_data.get("skills", [])).decode(),
                 "education": parsed_data.get("education"),
-                "last_two_jobs": json.dumps(parsed_data.get("lastTwoJobs", [])),
+                "last_two_jobs": orjson.dumps(parsed_data.get("lastTwoJobs", [])).decode(),
                 "summary": parsed_data.get("summary"),
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
+                "created_at": now,
+                "updated_at": now
             }
             
             result = supabase.table("cv_records").insert(cv_data).execute()
@@ -71,6 +74,16 @@ class CVRecordService:
             print(f"Error getting CV record: {e}")
             return None
     
+    @staticmethod
+    def get_cv_record_full(user_id: str) -> Optional[Dict[str, Any]]:
+        """Get the latest CV record for a user with its career paths, skill gaps and resume optimizations embedded"""
+        try:
+            result = supabase.table("cv_records").select("*, career_paths(*), skill_gaps(*), resume_optimizations(*)").eq("user_id", user_id).order("created_at", desc=True).limit(1).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            print(f"Error getting full CV record: {e}")
+            return None
+    
     @staticmethod
     def get_cv_record_by_id(cv_id: int) -> Optional[Dict[str, Any]]:
         """Get a CV record by ID"""
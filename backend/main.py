@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Depends, HTTPException, Request, Header, File, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer
+from fastapi.concurrency import run_in_threadpool
 from ai_services import generate_career_path, analyze_skill_gap, optimize_resume, parse_resume_content
 try:
     from database import CVRecordService, CareerPathService, SkillGapService, ResumeOptimizationService
@@ -17,6 +18,9 @@ except Exception as e:
         def get_cv_record_by_user(*args, **kwargs):
             return None
         @staticmethod
+        def get_cv_record_full(*args, **kwargs):
+            return None
+        @staticmethod
         def create_career_path(*args, **kwargs):
             return {"id": 1, "message": "Database not configured"}
         @staticmethod
@@ -36,7 +40,7 @@ from typing import List, Dict, Any, Optional
 import PyPDF2
 import docx
 import io
-import json
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -102,19 +106,13 @@ def extract_text_from_file(file: UploadFile) -> str:
             # Extract text from PDF
             pdf_content = io.BytesIO(file.file.read())
             pdf_reader = PyPDF2.PdfReader(pdf_content)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
         
         elif file.content_type in ['application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'application/msword']:
             # Extract text from DOCX
             doc_content = io.BytesIO(file.file.read())
             doc = docx.Document(doc_content)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         
         elif file.content_type == 'text/plain':
             # Extract text from TXT
@@ -144,14 +142,14 @@ async def parse_resume(file: UploadFile = File(...)):
         # Reset file pointer for text extraction
         file.file.seek(0)
         
-        # Extract text from the uploaded file
-        resume_text = extract_text_from_file(file)
+        # Extract text from the uploaded file off the event loop
+        resume_text = await run_in_threadpool(extract_text_from_file, file)
         
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from the uploaded file")
         
-        # Parse the resume using AI
-        parsed_data = parse_resume_content(resume_text=resume_text)
+        # Parse the resume using AI (blocking LLM call, run in a worker thread)
+        parsed_data = await run_in_threadpool(parse_resume_content, resume_text=resume_text)
         
         return {
             "parsed_data": parsed_data,
@@ -195,9 +193,26 @@ async def get_user_cv_records(user_id: str):
         if cv_record:
             # Parse JSON fields
             if cv_record.get("skills"):
-                cv_record["skills"] = json.loads(cv_record["skills"])
+                cv_record["skills"] = orjson.loads(cv_record["skills"])
+            if cv_record.get("last_two_jobs"):
+                cv_record["last_two_jobs"] = orjson.loads(cv_record["last_two_jobs"])
+            return cv_record
+        else:
+            return {"message": "No CV record found for this user"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/cv-records/{user_id}/full")
+async def get_user_cv_record_full(user_id: str):
+    try:
+        # Single round-trip: related analyses are embedded via their cv_record_id foreign keys
+        cv_record = CVRecordService.get_cv_record_full(user_id)
+        if cv_record:
+            # Parse JSON fields
+            if cv_record.get("skills"):
+                cv_record["skills"] = orjson.loads(cv_record["skills"])
             if cv_record.get("last_two_jobs"):
-                cv_record["last_two_jobs"] = json.loads(cv_record["last_two_jobs"])
+                cv_record["last_two_jobs"] = orjson.loads(cv_record["last_two_jobs"])
             return cv_record
         else:
             return {"message": "No CV record found for this user"}
@@ -212,14 +227,15 @@ async def get_career_path(request: CareerPathRequest):
             cv_record = CVRecordService.get_cv_record_by_id(request.cv_record_id)
             if cv_record:
                 # Use skills from CV record
-                skills_from_cv = json.loads(cv_record.get("skills", "[]"))
+                skills_from_cv = orjson.loads(cv_record.get("skills", "[]"))
                 skills_to_use = skills_from_cv if skills_from_cv else request.skills
             else:
                 skills_to_use = request.skills
         else:
             skills_to_use = request.skills
         
-        career_path = generate_career_path(
+        career_path = await run_in_threadpool(
+            generate_career_path,
             job_title=request.job_title,
             experience=request.experience,
             skills=skills_to_use
@@ -247,14 +263,15 @@ async def get_skill_gap_analysis(request: SkillGapRequest):
             cv_record = CVRecordService.get_cv_record_by_id(request.cv_record_id)
             if cv_record:
                 # Use skills from CV record
-                skills_from_cv = json.loads(cv_record.get("skills", "[]"))
+                skills_from_cv = orjson.loads(cv_record.get("skills", "[]"))
                 skills_to_use = skills_from_cv if skills_from_cv else request.skills
             else:
                 skills_to_use = request.skills
         else:
             skills_to_use = request.skills
         
-        analysis = analyze_skill_gap(
+        analysis = await run_in_threadpool(
+            analyze_skill_gap,
             skills=skills_to_use,
             job_description=request.job_description
         )
@@ -283,7 +300,8 @@ async def get_resume_optimization(request: ResumeOptimizationRequest):
                 # Use raw text from CV record if available
                 resume_text_to_use = cv_record.get("raw_text", request.resume_text)
         
-        optimization = optimize_resume(
+        optimization = await run_in_threadpool(
+            optimize_resume,
             resume_text=resume_text_to_use,
             job_description=request.job_description
         )